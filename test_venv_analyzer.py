@@ -0,0 +1,32 @@
+import os
+import time
+
+import venv_analyzer
+
+
+def _make_venv(path):
+    """Create a minimal venv layout with a few files."""
+    (path / 'bin').mkdir(parents=True)
+    (path / 'pyvenv.cfg').write_text('home = /usr/bin\n')
+    (path / 'bin' / 'python').write_bytes(b'\0' * 100)
+
+
+def _set_atime(root, timestamp):
+    """Set the access time of a tree, directories included, to a timestamp."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            os.utime(path, (timestamp, os.stat(path).st_mtime))
+    os.utime(root, (timestamp, os.stat(root).st_mtime))
+
+
+def test_old_venvs_are_reported_unused(tmp_path):
+    # One venv matched by name, one only by its pyvenv.cfg/bin indicators
+    _make_venv(tmp_path / 'a' / 'venv')
+    _make_venv(tmp_path / 'b' / 'myenv')
+    _set_atime(tmp_path, time.time() - 400 * 86400)
+
+    analysis = venv_analyzer.analyze_venv_folders(venv_analyzer._scan(tmp_path), days_threshold=30)
+
+    assert analysis['count'] == 2
+    assert analysis['unused_count'] == 2
@@ -7,187 +7,342 @@ and displays information about their size and count.
 """
 
 import os
+import queue
 import sys
+import threading
 import argparse
+import functools
+import heapq
+import multiprocessing
 import shutil
+import stat
+import subprocess
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterable, Iterator, Union
 import humanize
 
 
-def is_venv_folder(path: Path) -> bool:
+# Common venv folder names
+_VENV_NAMES = frozenset({
+    'venv', 'env', '.venv', '.env', 'virtualenv',
+    'virtual_env', 'python_env', 'pyenv'
+})
+
+# Files and directories whose presence marks a venv folder
+_VENV_INDICATORS = frozenset({
+    'Scripts',  # Windows
+    'bin',      # Unix/Linux
+    'pyvenv.cfg',
+    'activate',
+    'activate.bat',
+    'activate.ps1'
+})
+
+# Directories that rarely hold venvs but can contain huge numbers of files;
+# they are not searched unless --no-skip is given. .tox is deliberately not
+# listed: its environments are real venvs, and often large ones
+_SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.mypy_cache',
+    '.pytest_cache', 'target', 'build', 'dist', '.idea', '.vscode'
+})
+
+
+def is_venv_folder(path: Union[str, Path], child_names=None) -> bool:
     """
     Check if a directory is a virtual environment folder.
     
     Args:
         path: Path to the directory to check
+        child_names: Names of the entries inside the directory, if already
+            listed by the caller (None to list them here, empty to only
+            check the folder name)
         
     Returns:
         bool: True if it's a venv folder, False otherwise
     """
-    # Common venv folder names
-    venv_names = {
-        'venv', 'env', '.venv', '.env', 'virtualenv', 
-        'virtual_env', 'python_env', 'pyenv'
-    }
-    
     # Check if the folder name matches common venv patterns
-    if path.name in venv_names:
+    if os.path.basename(path) in _VENV_NAMES:
         return True
     
-    # Check for common venv indicators
-    venv_indicators = [
-        'Scripts',  # Windows
-        'bin',      # Unix/Linux
-        'pyvenv.cfg',
-        'activate',
-        'activate.bat',
-        'activate.ps1'
-    ]
-    
-    for indicator in venv_indicators:
-        if (path / indicator).exists():
-            return True
+    # Check for common venv indicators with a single directory listing
+    if child_names is None:
+        try:
+            with os.scandir(path) as it:
+                child_names = {entry.name for entry in it}
+        except OSError:
+            return False
     
-    return False
+    return not _VENV_INDICATORS.isdisjoint(child_names)
+
+
+# Windows reparse tags of directory links: IO_REPARSE_TAG_MOUNT_POINT
+# (junctions) and IO_REPARSE_TAG_SYMLINK
+_LINK_REPARSE_TAGS = frozenset({0xA0000003, 0xA000000C})
 
 
-def get_directory_size(path: Path) -> int:
+def _is_plain_dir(entry: os.DirEntry) -> bool:
     """
-    Calculate the total size of a directory in bytes.
+    Check if a directory entry is a real directory that is safe to descend into.
+    
+    Symlinks and Windows junctions are excluded so that walks never leave
+    the tree they were started in or loop back on themselves.
     
     Args:
-        path: Path to the directory
+        entry: Directory entry to check
         
     Returns:
-        int: Size in bytes
+        bool: True if it's a directory that is not a link, False otherwise
     """
-    total_size = 0
-    
-    try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = Path(dirpath) / filename
-                try:
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
-                except (OSError, PermissionError):
-                    # Skip files we can't access
-                    continue
-    except (OSError, PermissionError):
-        # Skip directories we can't access
-        pass
+    if not entry.is_dir(follow_symlinks=False):
+        return False
+    
+    if os.name == 'nt':
+        # Junctions are reported as directories by is_dir(); other reparse-point
+        # directories (OneDrive placeholders, dedup, ...) hold real files.
+        # The reparse tag is cached on the DirEntry, so this costs no syscall
+        is_junction = getattr(entry, 'is_junction', None)
+        if is_junction is not None:
+            return not is_junction()
+        reparse_tag = getattr(entry.stat(follow_symlinks=False), 'st_reparse_tag', 0)
+        return reparse_tag not in _LINK_REPARSE_TAGS
+    
+    return True
+
+
+def _list_dir(path) -> List[os.DirEntry]:
+    """
+    List the entries of a directory with a single os.scandir call.
     
-    return total_size
+    Args:
+        path: Directory to list
+        
+    Returns:
+        List[os.DirEntry]: Entries inside the directory
+    """
+    with os.scandir(path) as it:
+        return list(it)
 
 
-def get_venv_access_time(path: Path) -> datetime:
+def _dir_size_and_atime(path: str, stop: threading.Event = None) -> Tuple[int, float]:
     """
-    Get the most recent access time of a virtual environment.
+    Sum file sizes and track the latest file access time below a directory in one walk.
+    
+    Walks the tree with an explicit stack of os.scandir calls so the
+    file type and stat results cached on each DirEntry are reused instead
+    of issuing extra syscalls per file. On POSIX systems, a file hard-linked
+    several times below the directory is only counted once; links to files
+    outside it are counted in full.
     
     Args:
-        path: Path to the venv folder
+        path: Directory path as a string
+        stop: Event that abandons the walk when set, checked between directories
         
     Returns:
-        datetime: Most recent access time
+        Tuple[int, float]: Size in bytes and most recent file access timestamp
     """
-    latest_access = datetime.fromtimestamp(0)  # Start with epoch time
+    total_size = 0
+    # Start with epoch time. Directory access times are not used: listing a
+    # directory, as the search itself does, can update them
+    latest_access = 0.0
     
-    try:
-        # Check the venv folder itself
-        stat = path.stat()
-        latest_access = max(latest_access, datetime.fromtimestamp(stat.st_atime))
-        
-        # Check key venv files and directories for access time
-        key_paths = [
-            path / 'Scripts',
-            path / 'bin',
-            path / 'pyvenv.cfg',
-            path / 'activate',
-            path / 'activate.bat',
-            path / 'activate.ps1',
-            path / 'python.exe',
-            path / 'Scripts' / 'python.exe',
-            path / 'bin' / 'python'
-        ]
-        
-        for key_path in key_paths:
-            if key_path.exists():
+    stack = [path]
+    seen = set()
+    
+    while stack:
+        if stop is not None and stop.is_set():
+            break
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            # Skip directories we can't access
+            continue
+        with it:
+            for entry in it:
                 try:
-                    stat = key_path.stat()
-                    latest_access = max(latest_access, datetime.fromtimestamp(stat.st_atime))
-                except (OSError, PermissionError):
-                    continue
+                    if _is_plain_dir(entry):
+                        stack.append(entry.path)
+                        continue
                     
-    except (OSError, PermissionError):
-        pass
+                    # One lstat gives both the file type and the size
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    # Skip files we can't access
+                    continue
+                
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                
+                if st.st_nlink > 1:
+                    # Count files hard-linked within this venv once. DirEntry.stat()
+                    # reports st_nlink as 0 on Windows, so this is POSIX-only
+                    key = (st.st_dev, st.st_ino)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                
+                total_size += st.st_size
+                if st.st_atime > latest_access:
+                    latest_access = st.st_atime
     
-    return latest_access
+    return total_size, latest_access
 
 
-def is_venv_unused(path: Path, days_threshold: int) -> bool:
+def _measure_venv(path: str) -> Tuple[str, int, float]:
     """
-    Check if a virtual environment is unused based on access time.
+    Measure a venv folder in a worker process.
     
     Args:
-        path: Path to the venv folder
-        days_threshold: Number of days without access to consider it unused
+        path: Venv folder path as a string
         
     Returns:
-        bool: True if the venv is unused, False otherwise
+        Tuple[str, int, float]: Venv path, size in bytes and latest access timestamp
     """
-    try:
-        access_time = get_venv_access_time(path)
-        threshold_time = datetime.now() - timedelta(days=days_threshold)
-        return access_time < threshold_time
-    except (OSError, PermissionError):
-        # If we can't access the folder, consider it unused
-        return True
+    size, access_time = _dir_size_and_atime(path)
+    return path, size, access_time
 
 
-def find_venv_folders(root_path: Path, max_depth: int = None) -> List[Path]:
+def _iter_venv_folders(root_path: Path, max_depth: int = None, skip_dirs=_SKIP_DIRS) -> Iterator[str]:
     """
-    Recursively find all virtual environment folders in the given directory.
+    Yield virtual environment folders below a directory as they are found.
+    
+    The tree is walked with an explicit stack of pending directory paths
+    rather than recursion, so deep directory trees cannot hit the
+    interpreter's recursion limit, and only the directory being searched is
+    held in memory as a listing. Only the names and paths already on each
+    DirEntry are used, so no Path objects are built for the directories
+    being searched.
     
     Args:
         root_path: Root directory to search
         max_depth: Maximum depth to search (None for unlimited)
+        skip_dirs: Directory names that are not searched
         
-    Returns:
-        List[Path]: List of venv folder paths
+    Yields:
+        str: Venv folder path
     """
-    venv_folders = []
+    stack = [(os.fspath(root_path), 0)]
     
-    def search_recursive(path: Path, current_depth: int = 0):
-        if max_depth is not None and current_depth > max_depth:
-            return
-        
+    while stack:
+        path, depth = stack.pop()
         try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    # Check if this is a venv folder
-                    if is_venv_folder(item):
-                        venv_folders.append(item)
-                    else:
-                        # Continue searching in subdirectories
-                        search_recursive(item, current_depth + 1)
+            entries = _list_dir(path)
         except (OSError, PermissionError):
             # Skip directories we can't access
-            pass
+            continue
+        
+        # Directories were pushed only after failing the name check, so the
+        # indicators decide; the root itself is never reported
+        if depth > 0 and is_venv_folder(path, [entry.name for entry in entries]):
+            yield path
+            continue
+        
+        if max_depth is not None and depth > max_depth:
+            continue
+        
+        for entry in entries:
+            if entry.name in skip_dirs:
+                continue
+            try:
+                if not _is_plain_dir(entry):
+                    continue
+            except (OSError, PermissionError):
+                # Skip entries we can't inspect
+                continue
+            
+            # Name matches need no further I/O
+            if is_venv_folder(entry.path, ()):
+                yield entry.path
+            else:
+                # Listed when popped: checked for venv indicators and, within
+                # the depth limit, searched further
+                stack.append((entry.path, depth + 1))
+
+
+def _scan(root_path: Path, max_depth: int = None, skip_dirs=_SKIP_DIRS, jobs: int = None, found: List[str] = None) -> Iterator[Tuple[str, int, float]]:
+    """
+    Find and measure virtual environment folders in a single traversal.
+    
+    Venv folders are not descended into while searching; each one is handed
+    to a thread pool for sizing as soon as it is found, since the walks are
+    I/O-bound and os.scandir and os.stat release the GIL. Results are yielded
+    as soon as each venv has been measured, in completion order. If the
+    caller stops early, walks still running are abandoned at their next
+    directory so the process can exit promptly.
     
-    search_recursive(root_path)
-    return venv_folders
+    With more than one job, all venvs are found first and then measured by a
+    pool of worker processes, which also spreads the Python-side work of the
+    walks across CPU cores.
+    
+    Args:
+        root_path: Root directory to search
+        max_depth: Maximum depth to search (None for unlimited)
+        skip_dirs: Directory names that are not searched
+        jobs: Number of worker processes (None or 1 to use threads)
+        found: List that receives each venv path as soon as it is found,
+            whether or not it gets measured
+        
+    Yields:
+        Tuple[str, int, float]: Venv path, size in bytes and latest access timestamp
+    """
+    if found is None:
+        found = []
+    
+    if jobs is not None and jobs > 1:
+        for folder in _iter_venv_folders(root_path, max_depth, skip_dirs):
+            found.append(folder)
+        if not found:
+            return
+        
+        chunksize = max(1, len(found) // (jobs * 4))
+        with multiprocessing.Pool(jobs) as pool:
+            yield from pool.imap_unordered(_measure_venv, found, chunksize=chunksize)
+        return
+    
+    finished = queue.Queue()
+    pending = {}
+    stop = threading.Event()
+    
+    def collect(block: bool):
+        while pending and (block or not finished.empty()):
+            future = finished.get()
+            size, access_time = future.result()
+            yield pending.pop(future), size, access_time
+    
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for folder in _iter_venv_folders(root_path, max_depth, skip_dirs):
+            found.append(folder)
+            future = executor.submit(_dir_size_and_atime, folder, stop)
+            pending[future] = folder
+            future.add_done_callback(finished.put)
+            
+            # Report venvs that finished while the search goes on
+            yield from collect(block=False)
+        
+        yield from collect(block=True)
+    finally:
+        # If the caller stops early, don't start sizing venvs nobody will see
+        # and make the running walks return at their next directory; the
+        # worker threads are joined at interpreter exit, so they must finish
+        stop.set()
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
 
 
-def analyze_venv_folders(venv_folders: List[Path], days_threshold: int = None) -> Dict:
+def analyze_venv_folders(venv_results: Iterable[Tuple[str, int, float]], days_threshold: int = None, top_n: int = None) -> Dict:
     """
-    Analyze the found venv folders and return statistics.
+    Analyze the scanned venv folders and return statistics.
     
     Args:
-        venv_folders: List of venv folder paths
+        venv_results: (folder_path, size, access_timestamp) tuples as produced by _scan
         days_threshold: Days threshold for unused detection (None to disable)
+        top_n: Only keep the N largest folders in 'folder_sizes' (None to keep all)
         
     Returns:
         Dict: Analysis results
@@ -196,34 +351,35 @@ def analyze_venv_folders(venv_folders: List[Path], days_threshold: int = None) -
     folder_sizes = []
     unused_folders = []
     
-    for folder in venv_folders:
-        try:
-            size = get_directory_size(folder)
-            total_size += size
-            
-            # Get access time information
-            access_time = get_venv_access_time(folder)
-            is_unused = False
-            
-            if days_threshold is not None:
-                is_unused = is_venv_unused(folder, days_threshold)
-                if is_unused:
-                    unused_folders.append((folder, size, access_time))
-            
-            folder_sizes.append((folder, size, access_time, is_unused))
-            
-        except (OSError, PermissionError):
-            # Skip folders we can't access
-            continue
+    if days_threshold is not None:
+        threshold_time = time.time() - days_threshold * 86400
+    
+    for folder, size, access_time in venv_results:
+        total_size += size
+        
+        # Access times stay as timestamps; they are only formatted for display
+        is_unused = False
+        
+        if days_threshold is not None:
+            is_unused = access_time < threshold_time
+            if is_unused:
+                unused_folders.append((folder, size, access_time))
+        
+        folder_sizes.append((folder, size, access_time, is_unused))
+    
+    count = len(folder_sizes)
     
     # Sort by size (largest first)
-    folder_sizes.sort(key=lambda x: x[1], reverse=True)
+    if top_n is not None:
+        folder_sizes = heapq.nlargest(top_n, folder_sizes, key=lambda x: x[1])
+    else:
+        folder_sizes.sort(key=lambda x: x[1], reverse=True)
     
     # Sort unused folders by access time (oldest first)
     unused_folders.sort(key=lambda x: x[2])
     
     return {
-        'count': len(venv_folders),
+        'count': count,
         'total_size': total_size,
         'folder_sizes': folder_sizes,
         'unused_folders': unused_folders,
@@ -232,10 +388,100 @@ def analyze_venv_folders(venv_folders: List[Path], days_threshold: int = None) -
     }
 
 
-def delete_venv_folders(folders_to_delete: List[Tuple[Path, int]], root_path: Path) -> Dict:
+@functools.lru_cache(maxsize=1024)
+def _hsize(size: int) -> str:
+    """
+    Format a byte count for display, caching repeated sizes.
+    
+    Args:
+        size: Size in bytes
+        
+    Returns:
+        str: Human-readable size
+    """
+    return humanize.naturalsize(size)
+
+
+def _root_prefix(root_path: Path) -> str:
+    """
+    Build the string prefix shared by every scanned path below a root.
+    
+    Args:
+        root_path: Root directory that was analyzed
+        
+    Returns:
+        str: Root path with a trailing separator
+    """
+    return os.path.join(os.fspath(root_path), '')
+
+
+def _relative_path(path: str, root_prefix: str) -> str:
+    """
+    Strip the root prefix from a scanned path for display.
+    
+    Args:
+        path: Scanned venv folder path
+        root_prefix: Prefix built by _root_prefix
+        
+    Returns:
+        str: Path relative to the root, or the path unchanged if it is outside it
+    """
+    return path[len(root_prefix):] if path.startswith(root_prefix) else path
+
+
+def _clear_readonly(func, path, exc_info):
+    """
+    shutil.rmtree error handler that retries after clearing the read-only bit.
+    
+    Args:
+        func: Function that failed (os.unlink, os.rmdir, ...)
+        path: Path it failed on
+        exc_info: Exception information from sys.exc_info()
+    """
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _fast_rmtree(path: str):
+    """
+    Recursively delete a directory, using `rm -rf` on POSIX systems.
+    
+    Removing thousands of small files is much faster in `rm -rf` than
+    through shutil.rmtree's per-file Python calls. On Windows, and when `rm`
+    is not available, shutil.rmtree is used; paths are never passed through
+    cmd.exe, which would re-parse characters such as & and %.
+    
+    Args:
+        path: Directory to delete
+        
+    Raises:
+        OSError: If the directory could not be deleted
+    """
+    if os.name == 'nt':
+        shutil.rmtree(path, onerror=_clear_readonly)
+        return
+    
+    try:
+        result = subprocess.run(
+            ['rm', '-rf', '--', path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+    except FileNotFoundError:
+        shutil.rmtree(path)
+        return
+    
+    if result.returncode != 0:
+        raise OSError(result.stderr.strip() or f"rm exited with status {result.returncode}")
+
+
+def delete_venv_folders(folders_to_delete: List[Tuple[str, int]], root_path: Path) -> Dict:
     """
     Delete the specified venv folders and return deletion results.
     
+    Folders are deleted concurrently; results are printed as each one finishes.
+    
     Args:
         folders_to_delete: List of (folder_path, size) tuples to delete
         root_path: Root directory for relative path display
@@ -247,20 +493,30 @@ def delete_venv_folders(folders_to_delete: List[Tuple[Path, int]], root_path: Pa
     failed_count = 0
     freed_space = 0
     
+    root_prefix = _root_prefix(root_path)
+    
     print(f"\nDeleting {len(folders_to_delete)} venv folders...")
     print("-" * 60)
     
-    for folder, size in folders_to_delete:
-        relative_path = folder.relative_to(root_path)
-        try:
-            # Use shutil.rmtree for recursive deletion
-            shutil.rmtree(folder)
-            deleted_count += 1
-            freed_space += size
-            print(f"✓ Deleted: {relative_path} ({humanize.naturalsize(size)})")
-        except (OSError, PermissionError) as e:
-            failed_count += 1
-            print(f"✗ Failed to delete: {relative_path} - {e}")
+    max_workers = max(1, min(8, len(folders_to_delete)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fast_rmtree, folder): (folder, size)
+            for folder, size in folders_to_delete
+        }
+        
+        # Counters and output are only touched here, on the main thread
+        for future in as_completed(futures):
+            folder, size = futures[future]
+            relative_path = _relative_path(folder, root_prefix)
+            try:
+                future.result()
+                deleted_count += 1
+                freed_space += size
+                print(f"✓ Deleted: {relative_path} ({_hsize(size)})")
+            except (OSError, PermissionError) as e:
+                failed_count += 1
+                print(f"✗ Failed to delete: {relative_path} - {e}")
     
     return {
         'deleted_count': deleted_count,
@@ -275,22 +531,24 @@ def display_results(analysis: Dict, root_path: Path, verbose: bool = False, auto
     
     Args:
         analysis: Analysis results dictionary
-        root_path: Root directory that was analyzed
+        root_path: Resolved root directory that was analyzed
         verbose: Whether to show detailed information
         auto_delete: Whether to automatically offer deletion
         clean_unused: Whether to offer cleaning unused venvs
         days_threshold: Days threshold for unused detection
     """
+    root_prefix = _root_prefix(root_path)
+    
     print(f"\n{'='*60}")
     print(f"Virtual Environment Analysis Results")
     print(f"{'='*60}")
-    print(f"Root Directory: {root_path.absolute()}")
+    print(f"Root Directory: {root_path}")
     print(f"Total venv folders found: {analysis['count']}")
-    print(f"Total size: {humanize.naturalsize(analysis['total_size'])}")
+    print(f"Total size: {_hsize(analysis['total_size'])}")
     
     if days_threshold is not None:
         print(f"Unused venv folders (>={days_threshold} days): {analysis['unused_count']}")
-        print(f"Unused venv size: {humanize.naturalsize(analysis['unused_size'])}")
+        print(f"Unused venv size: {_hsize(analysis['unused_size'])}")
     
     print(f"{'='*60}")
     
@@ -302,20 +560,20 @@ def display_results(analysis: Dict, root_path: Path, verbose: bool = False, auto
         print("\nDetailed breakdown:")
         print("-" * 60)
         for i, (folder, size, access_time, is_unused) in enumerate(analysis['folder_sizes'], 1):
-            relative_path = folder.relative_to(root_path)
+            relative_path = _relative_path(folder, root_prefix)
             status = " (UNUSED)" if is_unused else ""
             print(f"{i:2d}. {relative_path}{status}")
-            print(f"    Size: {humanize.naturalsize(size)}")
-            print(f"    Last accessed: {access_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"    Size: {_hsize(size)}")
+            print(f"    Last accessed: {datetime.fromtimestamp(access_time).strftime('%Y-%m-%d %H:%M:%S')}")
             print()
     else:
         print("\nTop 5 largest venv folders:")
         print("-" * 60)
         for i, (folder, size, access_time, is_unused) in enumerate(analysis['folder_sizes'][:5], 1):
-            relative_path = folder.relative_to(root_path)
+            relative_path = _relative_path(folder, root_prefix)
             status = " (UNUSED)" if is_unused else ""
-            print(f"{i}. {relative_path}{status} - {humanize.naturalsize(size)}")
-            print(f"   Last accessed: {access_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"{i}. {relative_path}{status} - {_hsize(size)}")
+            print(f"   Last accessed: {datetime.fromtimestamp(access_time).strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Offer unused venv cleanup
     if clean_unused and analysis['unused_count'] > 0:
@@ -323,14 +581,15 @@ def display_results(analysis: Dict, root_path: Path, verbose: bool = False, auto
         print(f"Unused Virtual Environment Cleanup")
         print(f"{'='*60}")
         print(f"Found {analysis['unused_count']} unused venv folders (not accessed in {days_threshold}+ days)")
-        print(f"This would free up {humanize.naturalsize(analysis['unused_size'])} of disk space.")
+        print(f"This would free up {_hsize(analysis['unused_size'])} of disk space.")
         print()
         
         print("Unused venv folders (sorted by last access time):")
+        now = time.time()
         for i, (folder, size, access_time) in enumerate(analysis['unused_folders'], 1):
-            relative_path = folder.relative_to(root_path)
-            days_ago = (datetime.now() - access_time).days
-            print(f"{i}. {relative_path} ({humanize.naturalsize(size)}) - {days_ago} days ago")
+            relative_path = _relative_path(folder, root_prefix)
+            days_ago = int((now - access_time) // 86400)
+            print(f"{i}. {relative_path} ({_hsize(size)}) - {days_ago} days ago")
         
         print()
         response = input("Delete these unused venv folders? (y/N): ").strip().lower()
@@ -341,14 +600,15 @@ def display_results(analysis: Dict, root_path: Path, verbose: bool = False, auto
             confirm = input("Type 'DELETE' to confirm deletion: ").strip()
             
             if confirm == 'DELETE':
-                deletion_results = delete_venv_folders(analysis['unused_folders'], root_path)
+                unused_to_delete = [(folder, size) for folder, size, _ in analysis['unused_folders']]
+                deletion_results = delete_venv_folders(unused_to_delete, root_path)
                 
                 print(f"\n{'='*60}")
                 print(f"Deletion Summary")
                 print(f"{'='*60}")
                 print(f"Successfully deleted: {deletion_results['deleted_count']} folders")
                 print(f"Failed to delete: {deletion_results['failed_count']} folders")
-                print(f"Space freed: {humanize.naturalsize(deletion_results['freed_space'])}")
+                print(f"Space freed: {_hsize(deletion_results['freed_space'])}")
                 print(f"{'='*60}")
             else:
                 print("Deletion cancelled.")
@@ -364,12 +624,12 @@ def display_results(analysis: Dict, root_path: Path, verbose: bool = False, auto
         print(f"Cleanup Option")
         print(f"{'='*60}")
         print(f"Would you like to delete the top {len(top_5_folders)} largest venv folders?")
-        print(f"This would free up {humanize.naturalsize(total_size_top_5)} of disk space.")
+        print(f"This would free up {_hsize(total_size_top_5)} of disk space.")
         print()
         
         for i, (folder, size) in enumerate(top_5_folders, 1):
-            relative_path = folder.relative_to(root_path)
-            print(f"{i}. {relative_path} ({humanize.naturalsize(size)})")
+            relative_path = _relative_path(folder, root_prefix)
+            print(f"{i}. {relative_path} ({_hsize(size)})")
         
         print()
         response = input("Delete these folders? (y/N): ").strip().lower()
@@ -387,7 +647,7 @@ def display_results(analysis: Dict, root_path: Path, verbose: bool = False, auto
                 print(f"{'='*60}")
                 print(f"Successfully deleted: {deletion_results['deleted_count']} folders")
                 print(f"Failed to delete: {deletion_results['failed_count']} folders")
-                print(f"Space freed: {humanize.naturalsize(deletion_results['freed_space'])}")
+                print(f"Space freed: {_hsize(deletion_results['freed_space'])}")
                 print(f"{'='*60}")
             else:
                 print("Deletion cancelled.")
@@ -406,6 +666,8 @@ Examples:
   python venv_analyzer.py /path/to/dir       # Analyze specific directory
   python venv_analyzer.py -v                 # Verbose output
   python venv_analyzer.py --max-depth 3      # Limit search depth
+  python venv_analyzer.py --no-skip          # Also search .git, node_modules, ...
+  python venv_analyzer.py --jobs 4           # Size venvs in 4 worker processes
   python venv_analyzer.py --auto-delete      # Offer to delete top 5 largest
   python venv_analyzer.py --clean-unused 30  # Clean venvs unused for 30+ days
         """
@@ -430,6 +692,20 @@ Examples:
         help='Maximum depth to search (default: unlimited)'
     )
     
+    parser.add_argument(
+        '--no-skip',
+        action='store_true',
+        help='Also search directories that normally hold no venvs '
+             '(.git, node_modules, __pycache__, build, dist, ...)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        metavar='N',
+        help='Size venv folders in N worker processes (default: threads in a single process)'
+    )
+    
     parser.add_argument(
         '--auto-delete',
         action='store_true',
@@ -451,27 +727,57 @@ Examples:
         print("Use --auto-delete to delete the largest venvs, or --clean-unused to delete unused venvs.")
         sys.exit(1)
     
-    # Convert to Path object
-    root_path = Path(args.directory)
+    # Validate the number of worker processes
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1.")
+        sys.exit(1)
+    
+    # Resolve the root once; every path below is derived from it
+    root_path = Path(args.directory).resolve()
     
     # Validate the directory exists
     if not root_path.exists():
-        print(f"Error: Directory '{root_path}' does not exist.")
+        print(f"Error: Directory '{args.directory}' does not exist.")
         sys.exit(1)
     
     if not root_path.is_dir():
-        print(f"Error: '{root_path}' is not a directory.")
+        print(f"Error: '{args.directory}' is not a directory.")
         sys.exit(1)
     
-    print(f"Searching for virtual environment folders in: {root_path.absolute()}")
+    print(f"Searching for virtual environment folders in: {root_path}")
     print("This may take a moment for large directories...")
     
     try:
-        # Find venv folders
-        venv_folders = find_venv_folders(root_path, args.max_depth)
+        # Find and size venv folders in a single pass, reporting progress as we go
+        skip_dirs = frozenset() if args.no_skip else _SKIP_DIRS
+        venv_results = []
+        scanned_size = 0
+        show_progress = sys.stdout.isatty()
+        
+        found = []
+        scan = _scan(root_path, args.max_depth, skip_dirs, args.jobs, found)
+        
+        try:
+            for result in scan:
+                venv_results.append(result)
+                scanned_size += result[1]
+                if show_progress:
+                    progress = f"Scanned: {len(venv_results)} venvs, {_hsize(scanned_size)}"
+                    print(f"\r{progress:<60}", end="", flush=True)
+            if show_progress and venv_results:
+                print()
+        except KeyboardInterrupt:
+            # Stop the workers before reporting what was measured
+            scan.close()
+            unmeasured = len(found) - len(venv_results)
+            print(f"\nScan interrupted by user after finding {len(found)} venv folders.")
+            if unmeasured:
+                print(f"{unmeasured} of them were not measured and are left out of the results below.")
+            print("Showing partial results.")
         
-        # Analyze the results
-        analysis = analyze_venv_folders(venv_folders, args.clean_unused)
+        # Analyze the results; without --verbose only the top 5 are ever shown
+        top_n = None if args.verbose else 5
+        analysis = analyze_venv_folders(venv_results, args.clean_unused, top_n)
         
         # Display results
         display_results(analysis, root_path, args.verbose, args.auto_delete, args.clean_unused is not None, args.clean_unused)